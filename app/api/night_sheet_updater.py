@@ -114,9 +114,10 @@ def download_and_add_diagram_path(grouped_bookings: dict, sharepoint: Sharepoint
     return grouped_bookings
 
 
-def write_bookings_to_excel(bookings_by_date: dict, file_path: str):
-    wb = openpyxl.load_workbook(file_path)
+def write_bookings_to_workbook(wb, bookings_by_date: dict, inserted_rooms_by_sheet: dict = None) -> list:
     remaining_bookings = []
+    if inserted_rooms_by_sheet is None:
+        inserted_rooms_by_sheet = {}
 
     for sheet_name, bookings in bookings_by_date.items():
         if sheet_name not in wb.sheetnames:
@@ -141,7 +142,8 @@ def write_bookings_to_excel(bookings_by_date: dict, file_path: str):
             continue
 
         rows = data_range[1:]
-        inserted_rooms = []
+        # Shared across calls so a sheet written from several windows still sends duplicate rooms to turnovers
+        inserted_rooms = inserted_rooms_by_sheet.setdefault(sheet_name, set())
 
         for i, row in enumerate(rows):
             row_room = row[room_idx].value
@@ -173,8 +175,14 @@ def write_bookings_to_excel(bookings_by_date: dict, file_path: str):
                         row[drawings_idx].hyperlink = b["diagramPath"]
                         row[drawings_idx].value = b["diagramPath"]
 
-                    inserted_rooms.append(b["roomDescription"])
+                    inserted_rooms.add(b["roomDescription"])
+
+    return remaining_bookings
+
 
+def write_bookings_to_excel(bookings_by_date: dict, file_path: str):
+    wb = openpyxl.load_workbook(file_path)
+    remaining_bookings = write_bookings_to_workbook(wb, bookings_by_date)
     wb.save(file_path)
     print("\nRemaining bookings not added due to duplicate rooms:")
     for b in remaining_bookings:
@@ -190,16 +198,6 @@ def filter_events(api_data):
     })
 
 
-def process_excel_night_sheet(bookings: list, file_path: str, sharepoint: Sharepoint):
-    grouped = group_bookings_by_date(bookings, sheet_type='night_sheet')
-    print("📅 Night Sheet Grouped bookings by date:")
-    for date, items in grouped.items():
-        print(f" - {date}: {len(items)} bookings")
-    if not IMAGES_DOWNLOADED_FLAG:
-        grouped = download_and_add_diagram_path(grouped, sharepoint)
-    remaining_bookings = write_bookings_to_excel(grouped, file_path)
-    return remaining_bookings
-
 def process_excel_turnovers_sheet(bookings: list, file_path: str):
     grouped = group_bookings_by_date(bookings, sheet_type='turnovers')
     print("📅 Turnovers Grouped bookings by date:")
@@ -207,42 +205,92 @@ def process_excel_turnovers_sheet(bookings: list, file_path: str):
         print(f" - {date}: {len(items)} bookings")
     write_bookings_to_excel(grouped, file_path)
 
-def run_on_sharepoint_file(sharepoint: Sharepoint, start_date: datetime, end_date: datetime, folder_path: str, night_sheet_filename: str = "Night Sheet - Multi Day Test.xlsx", turnovers_sheet_filename: str = "Turnovers - Multi Day Test.xlsx") -> str:
-    events_body = {
-        "start": format_date(start_date),
-        "end": format_date(end_date),
-        "buildingIds": BUILDING_IDS
-    }
 
-    events_data = fetch_api_data(GET_EVENTS_URL, events_body)
-    booking_ids = filter_events(events_data)
+def iter_night_sheet_days(sharepoint: Sharepoint, start_date: datetime, end_date: datetime, file_path: str):
+    """Fill the night sheet one day at a time, yielding after each day is written.
 
-    booking_details_body = {
-        "bookingIds": booking_ids
-    }
+    Each day's bookings are fetched, given diagram links and written to their
+    ``MM_DD_YYYY`` sheet before the next day is requested, so only a single
+    day of booking data is held in memory. Yields ``(sheet_name, booking_count,
+    remaining_bookings)`` once per day, named after that day's sheet; the count
+    also covers bookings the window placed on a neighbouring sheet. The
+    workbook is saved once, after the last day.
+    """
+    wb = openpyxl.load_workbook(file_path)
+    seen_ids = set()
+    inserted_rooms_by_sheet = {}
+    day = start_date
+    while day < end_date:
+        next_day = day + timedelta(days=1)
+        events_body = {
+            "start": format_date(day),
+            "end": format_date(next_day),
+            "buildingIds": BUILDING_IDS
+        }
+        # Bookings overlapping two windows are only written the first time they are seen
+        booking_ids = [i for i in filter_events(fetch_api_data(GET_EVENTS_URL, events_body)) if i not in seen_ids]
+        seen_ids.update(booking_ids)
+
+        grouped = {}
+        if booking_ids:
+            booking_data = fetch_api_data(GET_BOOKING_DETAILS_URL, {"bookingIds": booking_ids})
+            grouped = group_bookings_by_date(booking_data, sheet_type='night_sheet')
+
+        remaining_bookings = []
+        if grouped:
+            if not IMAGES_DOWNLOADED_FLAG:
+                grouped = download_and_add_diagram_path(grouped, sharepoint)
+            remaining_bookings = write_bookings_to_workbook(wb, grouped, inserted_rooms_by_sheet)
+
+        booking_count = sum(len(bookings) for bookings in grouped.values())
+        yield (day - timedelta(days=1)).strftime("%m_%d_%Y"), booking_count, remaining_bookings
+
+        day = next_day
 
-    booking_data = fetch_api_data(GET_BOOKING_DETAILS_URL, booking_details_body)
+    wb.save(file_path)
 
+
+def iter_run_on_sharepoint_file(sharepoint: Sharepoint, start_date: datetime, end_date: datetime, folder_path: str, night_sheet_filename: str = "Night Sheet - Multi Day Test.xlsx", turnovers_sheet_filename: str = "Turnovers - Multi Day Test.xlsx"):
+    """Process the night and turnovers sheets, yielding a status message per day."""
     result = sharepoint.download_file(night_sheet_filename, folder_path)
     if result["error"]:
         raise Exception(f"Download failed: {result['error']}")
-    local_path = result["downloaded_file_path"]
+    night_sheet_path = result["downloaded_file_path"]
 
-    remaining_bookings = process_excel_night_sheet(booking_data, local_path, sharepoint)
-    if remaining_bookings:
-        result = sharepoint.download_file(turnovers_sheet_filename, folder_path)
-        if result["error"]:
-            raise Exception(f"Download failed: {result['error']}")
-        local_path = result["downloaded_file_path"]
-        process_excel_turnovers_sheet(remaining_bookings, local_path)
+    remaining_bookings = []
+    for sheet_name, booking_count, remaining in iter_night_sheet_days(sharepoint, start_date, end_date, night_sheet_path):
+        remaining_bookings.extend(remaining)
+        yield f"📅 {sheet_name}: {booking_count} bookings written"
 
-    with open(local_path, "rb") as f:
+    with open(night_sheet_path, "rb") as f:
         content = f.read()
     upload_result = sharepoint.upload_file(night_sheet_filename, folder_path, content)
     if upload_result["error"]:
         raise Exception(f"Upload failed: {upload_result['error']}")
 
-    return f"✅ Processed and uploaded '{night_sheet_filename}' to '{folder_path}'"
+    if remaining_bookings:
+        result = sharepoint.download_file(turnovers_sheet_filename, folder_path)
+        if result["error"]:
+            raise Exception(f"Download failed: {result['error']}")
+        turnovers_path = result["downloaded_file_path"]
+        process_excel_turnovers_sheet(remaining_bookings, turnovers_path)
+
+        with open(turnovers_path, "rb") as f:
+            content = f.read()
+        upload_result = sharepoint.upload_file(turnovers_sheet_filename, folder_path, content)
+        if upload_result["error"]:
+            raise Exception(f"Upload failed: {upload_result['error']}")
+
+    yield f"✅ Processed and uploaded '{night_sheet_filename}' to '{folder_path}'"
+
+
+def run_on_sharepoint_file(sharepoint: Sharepoint, start_date: datetime, end_date: datetime, folder_path: str, night_sheet_filename: str = "Night Sheet - Multi Day Test.xlsx", turnovers_sheet_filename: str = "Turnovers - Multi Day Test.xlsx") -> str:
+    last_status = None
+    for status in iter_run_on_sharepoint_file(sharepoint, start_date, end_date, folder_path, night_sheet_filename, turnovers_sheet_filename):
+        if last_status:
+            print(last_status)
+        last_status = status
+    return last_status
 
 
 # Example execution
@@ -1,8 +1,11 @@
 import os
+import json
 from pathlib import PurePath
 import environ
 import threading
 from office365.sharepoint.client_context import ClientContext
+from office365.runtime.auth.authentication_context import AuthenticationContext
+from office365.runtime.auth.providers.saml_token_provider import SamlTokenProvider
 from office365.runtime.auth.user_credential import UserCredential
 from office365.sharepoint.files.file import File
 
@@ -14,18 +17,48 @@ SHAREPOINT_SITE_NAME = env("SHAREPOINT_SITE_NAME")
 SHAREPOINT_DOC_LIBRARY = env("SHAREPOINT_DOC_LIBRARY")
 
 
+class CookieAuthenticationContext(AuthenticationContext):
+    """Authenticates every request with previously captured SharePoint session cookies."""
+
+    def __init__(self, url, cookies):
+        super().__init__(url)
+        self.cookie_header = "; ".join(f"{name}={value}" for name, value in cookies.items())
+
+    def authenticate_request(self, request):
+        request.set_header("Cookie", self.cookie_header)
+
+
 class Sharepoint:
-    def __init__(self, email, password):
+    def __init__(self, email, password=None, cookies=None):
         self.lock = threading.Lock()  # For thread-safe folder creation
         self.email = email
         self.password = password
+        self.cookies = cookies  # Cached session cookies, only used when resuming without a password
 
     def _auth(self):
         # Always return a new ClientContext to ensure thread safety
+        if self.cookies and not self.password:
+            return ClientContext(SHAREPOINT_SITE_URL, CookieAuthenticationContext(SHAREPOINT_SITE_URL, self.cookies))
         return ClientContext(SHAREPOINT_SITE_URL).with_credentials(
             UserCredential(self.email, self.password)
         )
 
+    def check_connection(self):
+        """Authenticate with a lightweight site lookup and return the session cookies."""
+        try:
+            cookies = self.cookies
+            if self.password:
+                # Sign in once up front so the FedAuth/rtFa cookies can be cached for the next start
+                provider = SamlTokenProvider(SHAREPOINT_SITE_URL, self.email, self.password, False)
+                cookies = json.loads(provider.get_authentication_cookie().to_json())
+
+            conn = ClientContext(SHAREPOINT_SITE_URL, CookieAuthenticationContext(SHAREPOINT_SITE_URL, cookies))
+            conn.web.select(["Title"]).get().execute_query()
+        except Exception as e:
+            return {"error": str(e), "cookies": None}
+
+        return {"error": None, "cookies": cookies}
+
     def _get_files_list(self, folder_name):
         conn = self._auth()
         target_folder_url = f'{SHAREPOINT_DOC_LIBRARY}/{folder_name}'
@@ -0,0 +1,55 @@
+import json
+import time
+
+import keyring
+
+KEYRING_SERVICE = "UTA_UC_NightSheetUpdater"
+KEYRING_USERNAME = "sharepoint_session"
+# Conservative upper bound, not the real cookie lifetime: the FedAuth cookie
+# expiry is not exposed, so a resumed session is still checked with
+# Sharepoint.check_connection before it is used.
+SESSION_TTL_SECONDS = 8 * 60 * 60
+
+
+def save_session(email: str, cookies: dict):
+    """Store the SharePoint session cookies in the OS credential store."""
+    session = {
+        "email": email,
+        "cookies": cookies,
+        "expires_at": time.time() + SESSION_TTL_SECONDS,
+    }
+    try:
+        keyring.set_password(KEYRING_SERVICE, KEYRING_USERNAME, json.dumps(session))
+    except Exception as e:
+        # e.g. no backend, or the cookies exceed the Windows Credential Manager size limit
+        print(f"⚠️ Could not store session: {e}")
+
+
+def load_session():
+    """Return the cached session, or None if it is missing or past SESSION_TTL_SECONDS."""
+    try:
+        raw = keyring.get_password(KEYRING_SERVICE, KEYRING_USERNAME)
+    except Exception as e:
+        print(f"⚠️ Could not read session: {e}")
+        return None
+
+    if not raw:
+        return None
+
+    try:
+        session = json.loads(raw)
+    except ValueError:
+        clear_session()
+        return None
+
+    if session.get("expires_at", 0) <= time.time() or not session.get("cookies"):
+        clear_session()
+        return None
+    return session
+
+
+def clear_session():
+    try:
+        keyring.delete_password(KEYRING_SERVICE, KEYRING_USERNAME)
+    except Exception:
+        pass
@@ -8,12 +8,13 @@ from kivymd.uix.boxlayout import MDBoxLayout
 from kivymd.uix.label import MDLabel
 from kivy.uix.screenmanager import Screen
 from kivy.clock import Clock
-from kivy.properties import StringProperty
+from kivy.properties import StringProperty, BooleanProperty
 from kivy.app import App
 from datetime import datetime
 from functools import partial
+import threading
 
-from api.night_sheet_updater import run_on_sharepoint_file
+from api.night_sheet_updater import iter_run_on_sharepoint_file
 
 DOUBLE_CLICK_DELAY = 0.4  # seconds
 
@@ -23,6 +24,8 @@ class DashboardScreen(Screen):
     turnover_sheet_path = StringProperty("")
     start_date_value = StringProperty("")
     end_date_value = StringProperty("")
+    run_status = StringProperty("")
+    is_running = BooleanProperty(False)
 
     current_path = ""
     path_history = []
@@ -30,10 +33,36 @@ class DashboardScreen(Screen):
     dialog = None
     file_type = None
     folder_cache = {}  # Cache: { "path": { "files": [...], "folders": [...] } }
+    prefetching = set()  # Paths with a listing still loading in the background
+    pending_browse_path = None
+
+    def prefetch_folder(self, sharepoint, path):
+        """Load a folder listing into the cache in the background."""
+        self.prefetching.add(path)
+
+        def _worker():
+            try:
+                self.folder_cache[path] = sharepoint.get_files_folders_list(path)
+            except Exception as e:
+                print(f"⚠️ Could not prefetch '/{path}': {e}")
+            Clock.schedule_once(lambda dt: self._on_prefetch_done(path))
+
+        threading.Thread(target=_worker, daemon=True).start()
+
+    def _on_prefetch_done(self, path):
+        self.prefetching.discard(path)
+        if self.pending_browse_path == path:
+            self.pending_browse_path = None
+            self._open_browser(path)
 
     def select_file(self, file_type):
         self.file_type = file_type
         self.sharepoint = App.get_running_app().sharepoint
+        if "" in self.prefetching:
+            # Open the browser once the in-flight listing lands instead of fetching it again
+            self.pending_browse_path = ""
+            self._open_snackbar(message="Loading folders...")
+            return
         self._open_browser(path="")
 
     def _open_snackbar(self, message):
@@ -207,8 +236,32 @@ class DashboardScreen(Screen):
             turnover_sheet_file_name = self.turnover_sheet_path.split("/")[-1]
             print("Night Sheet:", night_sheet_file_name)
             print("Turnovers Sheet:", turnover_sheet_file_name)
-            result = run_on_sharepoint_file(self.sharepoint, start_dt, end_dt, self.current_path, night_sheet_file_name, turnover_sheet_file_name)
-            print(result)
+            self.is_running = True
+            threading.Thread(
+                target=self._run_script_worker,
+                args=(start_dt, end_dt, self.current_path, night_sheet_file_name, turnover_sheet_file_name),
+                daemon=True,
+            ).start()
         except Exception as e:
             print("Error running script:", e)
             self._open_snackbar(message="⚠️ Error running script")
+
+    def _run_script_worker(self, start_dt, end_dt, folder_path, night_sheet_file_name, turnover_sheet_file_name):
+        # Stream day by day so long ranges stay bounded in memory and report progress
+        try:
+            status = None
+            for status in iter_run_on_sharepoint_file(self.sharepoint, start_dt, end_dt, folder_path, night_sheet_file_name, turnover_sheet_file_name):
+                print(status)
+                Clock.schedule_once(partial(self._set_run_status, status))
+            Clock.schedule_once(lambda dt: self._on_run_finished(status))
+        except Exception as e:
+            print("Error running script:", e)
+            Clock.schedule_once(lambda dt: self._on_run_finished("⚠️ Error running script"))
+
+    def _set_run_status(self, status, *args):
+        self.run_status = status
+
+    def _on_run_finished(self, message):
+        self.is_running = False
+        self.run_status = message
+        self._open_snackbar(message=message)
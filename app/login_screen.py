@@ -1,17 +1,21 @@
 import os
+import threading
 from kivymd.uix.screen import MDScreen
 from kivymd.uix.dialog import MDDialog
 from kivymd.uix.button import MDRaisedButton
 from kivy.app import App
+from kivy.clock import Clock
 from kivy.properties import ObjectProperty
 
 from api.office365_api import Sharepoint
+from api.session_store import save_session, load_session, clear_session
 
 REMEMBER_FILE = "remember_email.txt"
 
 class LoginScreen(MDScreen):
     dialog = None
     checkbox = ObjectProperty(None)
+    session_checked = False
 
     def on_pre_enter(self, *args):
         """Called automatically when the screen is about to be displayed."""
@@ -24,29 +28,79 @@ class LoginScreen(MDScreen):
             except Exception as e:
                 print(f"Error reading saved email: {e}")
 
+        # Only try the cached session once per app start
+        if not self.session_checked:
+            self.session_checked = True
+            session = load_session()
+            if session:
+                sharepoint = Sharepoint(session["email"], cookies=session["cookies"])
+                self._set_busy(True)
+                threading.Thread(target=self._resume_session_worker, args=(sharepoint,), daemon=True).start()
+
     def validate_credentials(self):
         email = self.ids.email.text
         password = self.ids.password.text
+        remember = self.ids.remember_checkbox.active
+
+        self._set_busy(True)
+        threading.Thread(target=self._login_worker, args=(email, password, remember), daemon=True).start()
 
+    def _login_worker(self, email, password, remember):
         try:
             sharepoint = Sharepoint(email, password)
-            sharepoint.get_files_folders_list('')  # Validate credentials
-            print('✅ Login Successful')
-            App.get_running_app().sharepoint = sharepoint
+            result = sharepoint.check_connection()
+            if result["error"]:
+                error = result["error"]
+                Clock.schedule_once(lambda dt: self._on_login_failed(error))
+                return
+
+            if remember and result["cookies"]:
+                save_session(email, result["cookies"])
+            else:
+                clear_session()
+            Clock.schedule_once(lambda dt: self._on_login_success(sharepoint, email, remember))
+        except Exception as e:
+            error = str(e)
+            Clock.schedule_once(lambda dt: self._on_login_failed(error))
+        finally:
+            Clock.schedule_once(lambda dt: self._set_busy(False))
 
-            # Handle "Remember Me"
-            if self.ids.remember_checkbox.active:
+    def _resume_session_worker(self, sharepoint):
+        try:
+            result = sharepoint.check_connection()
+            if result["error"]:
+                print(f"⚠️ Cached session expired: {result['error']}")
+                clear_session()
+                return
+            Clock.schedule_once(lambda dt: self._on_login_success(sharepoint))
+        except Exception as e:
+            print(f"⚠️ Could not resume session: {e}")
+        finally:
+            Clock.schedule_once(lambda dt: self._set_busy(False))
+
+    def _on_login_success(self, sharepoint, email=None, remember=None):
+        print('✅ Login Successful')
+        App.get_running_app().sharepoint = sharepoint
+
+        # Handle "Remember Me"
+        if remember is not None:
+            if remember:
                 with open(REMEMBER_FILE, "w") as f:
                     f.write(email)
             else:
                 if os.path.exists(REMEMBER_FILE):
                     os.remove(REMEMBER_FILE)
 
-            self.manager.current = "dashboard"
+        self.manager.get_screen("dashboard").prefetch_folder(sharepoint, "")
+        self.manager.current = "dashboard"
 
-        except Exception as e:
-            print(f"❌ Login error: {e}")
-            self.show_invalid_credentials_dialog()
+    def _on_login_failed(self, error):
+        print(f"❌ Login error: {error}")
+        self.show_invalid_credentials_dialog()
+
+    def _set_busy(self, busy):
+        self.ids.spinner.active = busy
+        self.ids.login_button.disabled = busy
 
     def show_invalid_credentials_dialog(self):
         if not self.dialog: